@@ -1,16 +1,68 @@
 class AutoRepr:
     """Automatically generates a __repr__ string for any class based on its attributes."""
+    __slots__ = ()
 
     def __repr__(self) -> str:
-        values = (f'{key}={value!r}' for key, value in vars(self).items())
-        return f'{self.__class__.__name__}({", ".join(values)})'
+        values = [f'{name}={getattr(self, name)!r}' for name in _public_slots(type(self)) if hasattr(self, name)]
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            values += [f'{key}={value!r}' for key, value in instance_dict.items()]
+
+        if not values:
+            return f'{type(self).__name__}()'
+        return f'{type(self).__name__}({", ".join(values)})'
+
+
+_public_slots_cache: dict[type, tuple[str, ...]] = {}
+
+
+def _public_slots(cls: type) -> tuple[str, ...]:
+    """Get the public slot names of a class and its bases, computed once per class."""
+    try:
+        return _public_slots_cache[cls]
+    except KeyError:
+        names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ())
+            if not name.startswith('_')
+        )
+        _public_slots_cache[cls] = names
+        return names
 
 
 class Singleton:
     """Implements the singleton pattern, ensuring a class only has one instance."""
-    _instances = {}
 
     def __new__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__new__(cls)
-        return cls._instances[cls]
+        # Read the class's own namespace so that subclasses don't inherit the parent's instance.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+
+class LazyAttribute:
+    """
+    A class attribute that is built on first access, from the class or any of its instances.
+
+    The value is built by calling `factory(*args, **kwargs)` and then stored on the class in place of the descriptor,
+    so it is built at most once.
+    """
+
+    def __init__(self, factory, *args, **kwargs) -> None:
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+        self._owner = None
+        self._name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, obj, owner: type | None = None):
+        value = self._factory(*self._args, **self._kwargs)
+        setattr(self._owner, self._name, value)
+        return value
@@ -1,16 +1,74 @@
+import asyncio
 import random
+import time
+from functools import lru_cache
+
 import requests
 from eth_typing import ChecksumAddress
 from fake_useragent import UserAgent
-from web3 import Web3
+from aiohttp import ClientTimeout
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider, WebsocketProviderV2
 from web3.eth import AsyncEth
+from web3._utils.request import DEFAULT_TIMEOUT
+from web3.exceptions import ProviderConnectionError, TimeExhausted
 from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from websockets.exceptions import ConnectionClosed
 
-from .exceptions import InvalidProxy
+from .exceptions import InvalidProxy, HTTPException
 from .transactions import Transaction
 from .wallet import Wallet
 from .contracts import Contracts
-from .models import Networks, Network
+from .models import Networks, Network, GasCache
+from .utils.utils import async_post, get_session, retain_session, release_session, to_checksum_address
+
+PROXY_CHECK_TTL = 300
+
+# proxy -> (check time, IP seen through the proxy)
+_proxy_check_cache: dict[str, tuple[float, str]] = {}
+
+
+@lru_cache(maxsize=None)
+def _get_user_agent() -> UserAgent:
+    """Load the user agent database once and share it between clients."""
+    return UserAgent()
+
+
+async def _track_gas(network: Network, gas_cache: GasCache) -> None:
+    """Update the gas values snapshot of the network on every new block."""
+    # While the subscription is down the snapshot goes stale and is refreshed over HTTP instead.
+    while True:
+        try:
+            async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(network.ws_rpc)) as w3:
+                await w3.eth.subscribe('newHeads')
+                async for message in w3.ws.listen_to_websocket():
+                    base_fee = message['result'].get('baseFeePerGas')
+                    if isinstance(base_fee, str):
+                        base_fee = int(base_fee, 16)
+
+                    gas_price = await w3.eth.gas_price
+                    max_priority_fee = await w3.eth.max_priority_fee if network.tx_type == 2 else None
+                    gas_cache.update(gas_price=gas_price, base_fee=base_fee, max_priority_fee=max_priority_fee)
+        except (ConnectionClosed, ProviderConnectionError, TimeExhausted, OSError, asyncio.TimeoutError):
+            pass
+
+        # Reconnect after a block, whether the connection failed or the node closed it.
+        await asyncio.sleep(network.block_time)
+
+
+class SharedSessionHTTPProvider(AsyncHTTPProvider):
+    """
+    An async HTTP provider that sends its requests through the shared keep-alive session, so TCP and TLS connections
+    are reused across all RPC calls. The session is taken from get_session on every request rather than from web3's
+    per-endpoint session cache, which would replace it with a private session once it is closed or its loop changes.
+    """
+    async def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+        request_kwargs = {'timeout': ClientTimeout(DEFAULT_TIMEOUT), **self.get_request_kwargs()}
+        session = await get_session()
+        async with session.post(self.endpoint_uri, data=request_data, **request_kwargs) as response:
+            response.raise_for_status()
+            return self.decode_rpc_response(await response.read())
 
 
 class Client:
@@ -28,9 +86,16 @@ class Client:
         self.proxy = self._configure_proxy(proxy, check_proxy)
         self.w3 = self._initialize_web3(self.network.rpc, self.proxy, self.headers)
         self.account = self._initialize_account(private_key)
+        # LocalAccount.sign_transaction parses the raw key and derives the public key on every call, so keep the parsed
+        # key object for signing.
+        self.signing_key = keys.PrivateKey(self.account.key)
+        self.gas_cache = GasCache.for_chain(self.network.chain_id)
+        self._tracking_gas = False
         self.wallet = Wallet(self)
         self.contracts = Contracts(self)
         self.transactions = Transaction(self)
+        self._closed = False
+        retain_session()
 
     @staticmethod
     def _generate_headers() -> dict:
@@ -38,7 +103,7 @@ class Client:
             'accept': '*/*',
             'accept-language': 'en-US,en;q=0.9',
             'content-type': 'application/json',
-            'user-agent': UserAgent().chrome
+            'user-agent': _get_user_agent().chrome
         }
 
     @staticmethod
@@ -47,18 +112,28 @@ class Client:
             proxy = f'http://{proxy}'
 
         if proxy and check_proxy:
-            your_ip = requests.get(
-                'http://eth0.me/', proxies={'http': proxy, 'https': proxy}, timeout=10
-            ).text.rstrip()
+            your_ip = Client._get_proxy_ip(proxy)
             if your_ip not in proxy:
                 raise InvalidProxy(f"Proxy doesn't work! Your IP is {your_ip}.")
 
         return proxy
 
+    @staticmethod
+    def _get_proxy_ip(proxy: str) -> str:
+        cached = _proxy_check_cache.get(proxy)
+        if cached and time.monotonic() - cached[0] < PROXY_CHECK_TTL:
+            return cached[1]
+
+        your_ip = requests.get(
+            'http://eth0.me/', proxies={'http': proxy, 'https': proxy}, timeout=10
+        ).text.rstrip()
+        _proxy_check_cache[proxy] = (time.monotonic(), your_ip)
+        return your_ip
+
     @staticmethod
     def _initialize_web3(rpc: str, proxy: str | None, headers: dict) -> Web3:
         return Web3(
-            provider=Web3.AsyncHTTPProvider(
+            provider=SharedSessionHTTPProvider(
                 endpoint_uri=rpc,
                 request_kwargs={'proxy': proxy, 'headers': headers}
             ),
@@ -71,6 +146,83 @@ class Client:
             return self.w3.eth.account.from_key(private_key=private_key)
         return self.w3.eth.account.create(extra_entropy=str(random.randint(1, 999_999_999)))
 
+    async def __aenter__(self) -> 'Client':
+        self.start_gas_tracker()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the client and stop its gas tracker. The shared HTTP session is closed once every client using it has
+        been closed.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        await self.stop_gas_tracker()
+        await release_session()
+
+    def start_gas_tracker(self) -> None:
+        """
+        Start following new blocks over the network WebSocket endpoint to keep the gas values snapshot up to date. The
+        tracker is shared by all clients of the chain and runs until every client that started it has stopped it or
+        has been closed. Does nothing if the network has no WebSocket endpoint or this client already started it.
+        """
+        if not self.network.ws_rpc or self._tracking_gas:
+            return
+
+        self._tracking_gas = True
+        self.gas_cache.tracker_users += 1
+        if self.gas_cache.tracker is None or self.gas_cache.tracker.done():
+            self.gas_cache.tracker = asyncio.get_running_loop().create_task(
+                _track_gas(network=self.network, gas_cache=self.gas_cache)
+            )
+
+    async def stop_gas_tracker(self) -> None:
+        """Stop following new blocks. The shared tracker is cancelled once no client uses it."""
+        if not self._tracking_gas:
+            return
+
+        self._tracking_gas = False
+        self.gas_cache.tracker_users -= 1
+        tracker = self.gas_cache.tracker
+        if self.gas_cache.tracker_users == 0 and tracker is not None:
+            self.gas_cache.tracker = None
+            tracker.cancel()
+            await asyncio.gather(tracker, return_exceptions=True)
+
+    async def batch_request(self, *calls: tuple[str, list]) -> list:
+        """
+        Send several JSON-RPC calls to the node in a single HTTP request.
+
+        Args:
+            *calls: (method, params) pairs, e.g. ('eth_gasPrice', []).
+
+        Returns:
+            list: the raw results of the calls, in the same order.
+
+        Raises:
+            HTTPException: if the node rejects the batch or any of the calls fails.
+        """
+        payload = [
+            {'jsonrpc': '2.0', 'id': call_id, 'method': method, 'params': params}
+            for call_id, (method, params) in enumerate(calls)
+        ]
+        responses = await async_post(url=self.network.rpc, headers=self.headers, json=payload, proxy=self.proxy)
+        if not isinstance(responses, list):
+            raise HTTPException(response=responses)
+
+        results = [None] * len(calls)
+        for response in responses:
+            if 'error' in response:
+                raise HTTPException(response=response)
+            results[response['id']] = response['result']
+
+        return results
+
     @staticmethod
     def get_checksum_address(address: str | ChecksumAddress) -> ChecksumAddress:
-        return Web3.to_checksum_address(address)
+        return to_checksum_address(address)
@@ -1,22 +1,36 @@
 from __future__ import annotations
+import asyncio
+import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING, List, Dict, Any
 
-from web3 import Web3
 from eth_typing import ChecksumAddress
 from web3.contract import AsyncContract, Contract
 
 from . import types
 from .models import DefaultABIs, RawContract
-from .utils.strings import text_between
-from .utils.utils import async_get
+from .utils.utils import async_get, to_checksum_address
 
 if TYPE_CHECKING:
     from .client import Client
 
+_TUPLE_RE = re.compile(r'\(([^()]*)\)')
+
+# The maximum number of contract instances kept by each client.
+CONTRACT_CACHE_SIZE = 256
+
+# Text signatures found for a hex signature never change, so they are shared between clients.
+_signatures_cache: dict[str, List[str]] = {}
+
 
 class Contracts:
     def __init__(self, client: Client) -> None:
         self.client = client
+        # (address, id(abi)) -> (abi, contract), least recently used first. The ABI is kept alongside so its id
+        # can't be reused while cached.
+        self._contract_cache: OrderedDict[tuple[ChecksumAddress, int], tuple[Any, AsyncContract]] = OrderedDict()
+        # The default token ABI is processed once here, instances only bind an address to it.
+        self._token_factory = client.w3.eth.contract(abi=DefaultABIs.Token)
 
     async def get_default_contract_instance(self, contract_address: ChecksumAddress | str) -> Contract | AsyncContract:
         """
@@ -28,8 +42,22 @@ class Contracts:
         Returns:
             Contract | AsyncContract: The token contract instance.
         """
-        contract_address = Web3.to_checksum_address(contract_address)
-        return self.client.w3.eth.contract(address=contract_address, abi=DefaultABIs.Token)
+        contract_address = to_checksum_address(contract_address)
+        return self._get_cached_contract(address=contract_address, abi=DefaultABIs.Token)
+
+    async def get_minimal_contract_instance(self, contract_address: ChecksumAddress | str) -> Contract | AsyncContract:
+        """
+        Get a token contract instance with only the balanceOf and decimals functions, which is cheaper to build than
+        the default one.
+
+        Args:
+            contract_address (ChecksumAddress | str): The contract address.
+
+        Returns:
+            Contract | AsyncContract: The token contract instance.
+        """
+        contract_address = to_checksum_address(contract_address)
+        return self._get_cached_contract(address=contract_address, abi=DefaultABIs.MinimalToken)
 
     async def get_contract_instance(
             self,
@@ -49,12 +77,45 @@ class Contracts:
         Raises:
             ValueError: If the ABI cannot be retrieved for the contract.
         """
-        contract_address, contract_abi = await self.get_contract_attributes(contract_address)
-        abi = abi or contract_abi
-        if not abi:
+        contract_address, contract_abi = self.parse_contract_attributes(contract_address)
+        if abi:
+            # An ABI passed by the caller is often built anew for each call, so it isn't worth caching.
+            return self.client.w3.eth.contract(address=contract_address, abi=abi)
+
+        if not contract_abi:
             raise ValueError('Cannot get ABI for contract')
 
-        return self.client.w3.eth.contract(address=contract_address, abi=abi)
+        return self._get_cached_contract(address=contract_address, abi=contract_abi)
+
+    def _get_cached_contract(
+            self, address: ChecksumAddress, abi: List[Dict[str, Any]] | str
+    ) -> AsyncContract | Contract:
+        """
+        Get a contract instance for the address and ABI, building it only once per pair. Only the most recently used
+        CONTRACT_CACHE_SIZE instances are kept.
+
+        Args:
+            address (ChecksumAddress): The contract address.
+            abi (List[Dict[str, Any]] | str): The contract ABI.
+
+        Returns:
+            AsyncContract | Contract: The contract instance.
+        """
+        key = (address, id(abi))
+        cached = self._contract_cache.get(key)
+        if cached is not None:
+            self._contract_cache.move_to_end(key)
+            return cached[1]
+
+        if abi is DefaultABIs.Token:
+            contract = self._token_factory(address=address)
+        else:
+            contract = self.client.w3.eth.contract(address=address, abi=abi)
+        self._contract_cache[key] = (abi, contract)
+        if len(self._contract_cache) > CONTRACT_CACHE_SIZE:
+            self._contract_cache.popitem(last=False)
+
+        return contract
 
     @staticmethod
     async def get_signature(hex_signature: str) -> List[str] | None:
@@ -67,13 +128,31 @@ class Contracts:
         Returns:
             List[str] | None: A list of matching text signatures, or None if not found.
         """
+        if hex_signature in _signatures_cache:
+            return _signatures_cache[hex_signature]
+
         try:
             response = await async_get(f'https://www.4byte.directory/api/v1/signatures/?hex_signature={hex_signature}')
             results = response['results']
-            return [m['text_signature'] for m in sorted(results, key=lambda result: result['created_at'])]
+            signatures = [m['text_signature'] for m in sorted(results, key=lambda result: result['created_at'])]
         except Exception:
             return None
 
+        _signatures_cache[hex_signature] = signatures
+        return signatures
+
+    async def get_signatures(self, hex_signatures: List[str]) -> List[List[str] | None]:
+        """
+        Find matching signatures for several signature hashes concurrently.
+
+        Args:
+            hex_signatures (List[str]): The signature hashes.
+
+        Returns:
+            List[List[str] | None]: The matching text signatures for each hash, in the same order.
+        """
+        return list(await asyncio.gather(*(self.get_signature(hex_signature) for hex_signature in hex_signatures)))
+
     async def parse_function_to_abi(self, text_signature: str) -> Dict[str, Any]:
         """
         Construct a function dictionary for the ABI based on the provided text signature.
@@ -85,12 +164,13 @@ class Contracts:
             Dict[str, Any]: The function dictionary for the ABI.
         """
         name, inputs, tuples = self._parse_signature(text_signature=text_signature)
-        return await self._build_function_abi(name=name, inputs=inputs, tuples=tuples)
+        return self._build_function_abi(name=name, inputs=inputs, tuples=tuples)
 
     @staticmethod
     async def get_contract_attributes(contract: types.Contract) -> tuple[ChecksumAddress, List[Dict[str, Any]] | None]:
         """
-        Convert different types of contracts to their address and ABI.
+        Convert different types of contracts to their address and ABI. An awaitable wrapper around the synchronous
+        `parse_contract_attributes`.
 
         Args:
             contract (types.Contract): The contract address or instance.
@@ -98,11 +178,9 @@ class Contracts:
         Returns:
             tuple[ChecksumAddress, List[Dict[str, Any]] | None]: The checksummed contract address and ABI.
         """
-        if isinstance(contract, (AsyncContract, RawContract)):
-            return contract.address, contract.abi
-        return Web3.to_checksum_address(contract), None
+        return Contracts.parse_contract_attributes(contract)
 
-    def _parse_signature(self, text_signature: str) -> tuple[str, List[str], List[List[str]]]:
+    def _parse_signature(self, text_signature: str) -> tuple[str, List[str], List[List[Dict[str, Any]]]]:
         """
         Parse the text signature into its components.
 
@@ -110,13 +188,28 @@ class Contracts:
             text_signature (str): The text signature.
 
         Returns:
-            tuple[str, List[str], List[List[str]]]: The function name, inputs, and tuples.
+            tuple[str, List[str], List[List[Dict[str, Any]]]]: The function name, inputs, and tuple components.
         """
         name, sign = self._split_signature(text_signature)
         sign, tuples = self._extract_tuples(sign)
         inputs = self._get_inputs(sign)
         return name, inputs, tuples
 
+    @staticmethod
+    def parse_contract_attributes(contract: types.Contract) -> tuple[ChecksumAddress, List[Dict[str, Any]] | None]:
+        """
+        Convert different types of contracts to their address and ABI.
+
+        Args:
+            contract (types.Contract): The contract address or instance.
+
+        Returns:
+            tuple[ChecksumAddress, List[Dict[str, Any]] | None]: The checksummed contract address and ABI.
+        """
+        if isinstance(contract, (AsyncContract, RawContract)):
+            return contract.address, contract.abi
+        return to_checksum_address(contract), None
+
     @staticmethod
     def _split_signature(text_signature: str) -> tuple[str, str]:
         """
@@ -132,22 +225,50 @@ class Contracts:
         return split_result[0], split_result[1] if len(split_result) > 1 else ''
 
     @staticmethod
-    def _extract_tuples(sign: str) -> tuple[str, List[List[str]]]:
+    def _extract_tuples(sign: str) -> tuple[str, List[List[Dict[str, Any]]]]:
         """
-        Extract tuples from the signature.
+        Extract tuples from the signature. Tuples are collapsed innermost first, then the components of each top-level
+        tuple are resolved recursively, so nested tuples get nested components.
 
         Args:
             sign (str): The rest of the signature.
 
         Returns:
-            tuple[str, List[List[str]]]: The modified signature and the extracted tuples.
+            tuple[str, List[List[Dict[str, Any]]]]: The modified signature and the components of its top-level tuples.
         """
-        tuples = []
-        while '(' in sign:
-            tuple_ = text_between(text=sign[:-1], begin='(', end=')')
-            tuples.append(tuple_.split(',') or [])
-            sign = sign.replace(f'({tuple_})', 'tuple')
-        return sign, tuples
+        # A collapsed group is replaced by 'tuple#<index in groups>' until it is resolved.
+        groups = []
+
+        def collapse(match: re.Match) -> str:
+            groups.append(match.group(1).split(',') if match.group(1) else [])
+            return f'tuple#{len(groups) - 1}'
+
+        def resolve(type_: str) -> tuple[str, List[Dict[str, Any]] | None]:
+            if not type_.startswith('tuple#'):
+                return type_, None
+            index, _, array = type_[len('tuple#'):].partition('[')
+            components = []
+            for comp_type in groups[int(index)]:
+                comp_type, comp_components = resolve(comp_type)
+                component = {'type': comp_type}
+                if comp_components is not None:
+                    component['components'] = comp_components
+                components.append(component)
+            return 'tuple' + (f'[{array}' if array else ''), components
+
+        # The closing parenthesis of the function arguments is not part of the last input.
+        body = sign[:-1] if sign.endswith(')') else sign
+        count = 1
+        while count:
+            body, count = _TUPLE_RE.subn(collapse, body)
+
+        inputs, tuples = [], []
+        for type_ in body.split(',') if body else []:
+            type_, components = resolve(type_)
+            if components is not None:
+                tuples.append(components)
+            inputs.append(type_)
+        return ','.join(inputs), tuples
 
     @staticmethod
     def _get_inputs(sign: str) -> List[str]:
@@ -163,14 +284,14 @@ class Contracts:
         return sign.split(',') if sign else []
 
     @staticmethod
-    async def _build_function_abi(name: str, inputs: List[str], tuples: List[List[str]]) -> Dict[str, Any]:
+    def _build_function_abi(name: str, inputs: List[str], tuples: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
         """
         Build the function ABI.
 
         Args:
             name (str): The function name.
             inputs (List[str]): The function inputs.
-            tuples (List[List[str]]): The tuples in the inputs.
+            tuples (List[List[Dict[str, Any]]]): The components of the tuples in the inputs.
 
         Returns:
             Dict[str, Any]: The function ABI dictionary.
@@ -184,24 +305,8 @@ class Contracts:
         i = 0
         for type_ in inputs:
             input_ = {'type': type_}
-            if type_ == 'tuple':
-                input_['components'] = [{'type': comp_type} for comp_type in tuples[i]]
+            if type_.startswith('tuple'):
+                input_['components'] = tuples[i]
                 i += 1
             function['inputs'].append(input_)
         return function
-
-    @staticmethod
-    async def _extract_contract_attributes(contract: types.Contract) -> tuple[
-        ChecksumAddress, List[Dict[str, Any]] | None]:
-        """
-        Extract the contract attributes.
-
-        Args:
-            contract (types.Contract): The contract address or instance.
-
-        Returns:
-            tuple[ChecksumAddress, List[Dict[str, Any]] | None]: The checksummed contract address and ABI.
-        """
-        if isinstance(contract, (AsyncContract, RawContract)):
-            return contract.address, contract.abi
-        return Web3.to_checksum_address(contract), None
@@ -1,4 +1,5 @@
-import json
+import asyncio
+import time
 from decimal import Decimal, InvalidOperation
 from dataclasses import dataclass
 
@@ -6,12 +7,19 @@ from eth_typing import ChecksumAddress
 from web3 import Web3
 import requests
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from . import exceptions
-from .classes import AutoRepr
+from .classes import AutoRepr, LazyAttribute
+from .utils.utils import json_loads, to_checksum_address
 
 
 class TokenAmount:
     """Represents an amount of a token in both Wei and Ether units."""
+    __slots__ = ('_amount', '_decimals', '_wei', '_pow', '_wei_int')
 
     def __init__(self, amount: int | float | str | Decimal, decimals: int = 18, wei: bool = False) -> None:
         """
@@ -22,18 +30,33 @@ class TokenAmount:
         :param wei: Whether the given amount is in Wei (True) or Ether (False).
         """
         self._amount = self._to_decimal(amount)
-        self.decimals = decimals
-        self.wei = wei
+        self._decimals = decimals
+        self._wei = wei
+        self._pow = 10 ** decimals
+        # Integer amounts convert to Wei exactly, so skip the Decimal arithmetic for them.
+        self._wei_int = (amount if wei else amount * self._pow) if isinstance(amount, int) else None
+
+    @property
+    def decimals(self) -> int:
+        """The number of decimal places the token uses. Read-only, since the Wei values are derived from it."""
+        return self._decimals
+
+    @property
+    def wei(self) -> bool:
+        """Whether the amount was given in Wei. Read-only, since the Wei values are derived from it."""
+        return self._wei
 
     @property
     def Wei(self) -> int:
         """The amount in Wei."""
-        return int(self._amount * 10 ** self.decimals) if not self.wei else int(self._amount)
+        if self._wei_int is not None:
+            return self._wei_int
+        return int(self._amount * self._pow) if not self._wei else int(self._amount)
 
     @property
     def Ether(self) -> Decimal:
         """The amount in Ether."""
-        return self._amount / 10 ** self.decimals if self.wei else self._amount
+        return self._amount / self._pow if self._wei else self._amount
 
     @staticmethod
     def _to_decimal(amount: int | float | str | Decimal) -> Decimal:
@@ -47,6 +70,85 @@ class TokenAmount:
         """Return the string representation of the amount in Ether."""
         return f'{self.Ether}'
 
+    @classmethod
+    def batch(cls, amounts, decimals: int = 18) -> 'TokenAmounts':
+        """
+        Create amounts of one token from many Wei values at once.
+
+        :param amounts: The amounts in Wei, as a sequence of ints or a NumPy array.
+        :param decimals: The number of decimal places the token uses.
+        :return: The TokenAmounts instance.
+        """
+        return TokenAmounts(amounts=amounts, decimals=decimals)
+
+
+class TokenAmounts:
+    """
+    Represents many amounts of one token, stored as a NumPy array in Wei. Amounts that fit into 64 bits are stored as
+    int64 or uint64 so that arithmetic is vectorized; larger ones fall back to Python ints in an object array.
+    """
+    __slots__ = ('_wei', '_decimals', '_pow')
+
+    def __init__(self, amounts, decimals: int = 18) -> None:
+        """
+        Initialize the TokenAmounts instance.
+
+        :param amounts: The amounts in Wei, as a sequence of ints or a NumPy array.
+        :param decimals: The number of decimal places the token uses.
+        """
+        if np is None:
+            raise ImportError('TokenAmounts requires numpy to be installed')
+
+        self._wei = amounts if isinstance(amounts, np.ndarray) else self._to_array(amounts)
+        self._decimals = decimals
+        self._pow = 10 ** decimals
+
+    @staticmethod
+    def _to_array(amounts):
+        """Convert the amounts to the narrowest integer array that holds them without overflow."""
+        for dtype in (np.int64, np.uint64):
+            try:
+                return np.array(amounts, dtype=dtype)
+            except OverflowError:
+                pass
+
+        return np.array(amounts, dtype=object)
+
+    @property
+    def decimals(self) -> int:
+        """The number of decimal places the token uses. Read-only, since Ether is derived from it."""
+        return self._decimals
+
+    @property
+    def Wei(self):
+        """The amounts in Wei."""
+        return self._wei
+
+    @property
+    def Ether(self):
+        """The amounts in Ether as floats, for aggregation and display."""
+        return self._wei.astype(np.float64) / self._pow
+
+    @property
+    def total(self) -> TokenAmount:
+        """The sum of the amounts."""
+        wei = self._wei
+        if wei.dtype != object and len(wei):
+            # The sum of fixed-width integers wraps around silently, so only use it when it can't overflow.
+            largest = max(abs(int(wei.max())), abs(int(wei.min())))
+            if largest * len(wei) > np.iinfo(wei.dtype).max:
+                wei = wei.astype(object)
+
+        return TokenAmount(amount=int(wei.sum()), decimals=self.decimals, wei=True)
+
+    def __len__(self) -> int:
+        return len(self._wei)
+
+    def __getitem__(self, index: int | slice) -> 'TokenAmount | TokenAmounts':
+        if isinstance(index, slice):
+            return TokenAmounts(amounts=self._wei[index], decimals=self.decimals)
+        return TokenAmount(amount=int(self._wei[index]), decimals=self.decimals, wei=True)
+
 
 @dataclass
 class DefaultABIs:
@@ -123,8 +225,65 @@ class DefaultABIs:
             'type': 'function'
         }]
 
+    # Only the functions needed to read token balances.
+    MinimalToken = [
+        {
+            'constant': True,
+            'inputs': [],
+            'name': 'decimals',
+            'outputs': [{'name': '', 'type': 'uint8'}],
+            'payable': False,
+            'stateMutability': 'view',
+            'type': 'function'
+        },
+        {
+            'constant': True,
+            'inputs': [{'name': 'account', 'type': 'address'}],
+            'name': 'balanceOf',
+            'outputs': [{'name': '', 'type': 'uint256'}],
+            'payable': False,
+            'stateMutability': 'view',
+            'type': 'function'
+        }]
+
+
+# Snapshot of https://chainid.network/chains.json for the chains used here, consulted before any network request.
+_CHAIN_ID_TO_SYMBOL: dict[int, str] = {
+    1: 'ETH',
+    5: 'ETH',
+    10: 'ETH',
+    56: 'BNB',
+    100: 'XDAI',
+    137: 'MATIC',
+    250: 'FTM',
+    324: 'ETH',
+    1101: 'ETH',
+    8453: 'ETH',
+    42161: 'ETH',
+    42170: 'ETH',
+    43114: 'AVAX',
+    59144: 'ETH',
+    11155111: 'ETH',
+}
+
+_RPC_TO_CHAIN_ID: dict[str, int] = {
+    'https://rpc.ankr.com/eth/': 1,
+    'https://arbitrum.llamarpc.com': 42161,
+    'https://nova.arbitrum.io/rpc/': 42170,
+    'https://rpc.ankr.com/optimism/': 10,
+    'https://rpc.ankr.com/bsc/': 56,
+    'https://rpc.ankr.com/polygon/': 137,
+    'https://rpc.ankr.com/avalanche/': 43114,
+    'https://rpc.ankr.com/eth_goerli/': 5,
+}
+
 
 class Network:
+    __slots__ = (
+        'name', 'rpc', 'chain_id', 'tx_type', 'native_coin_decimal', 'coin_symbol', 'explorer', 'block_time',
+        'supports_sync_send', 'ws_rpc'
+    )
+
     def __init__(
             self,
             name: str,
@@ -134,6 +293,9 @@ class Network:
             native_coin_decimal: int = 18,
             coin_symbol: str | None = None,
             explorer: str | None = None,
+            block_time: float = 12,
+            supports_sync_send: bool = False,
+            ws_rpc: str | None = None,
     ) -> None:
         self.name = name.lower()
         self.rpc = rpc
@@ -142,17 +304,28 @@ class Network:
         self.native_coin_decimal = native_coin_decimal
         self.coin_symbol = coin_symbol or self._get_coin_symbol()
         self.explorer = explorer
+        self.block_time = block_time
+        # Whether the RPC supports eth_sendRawTransactionSync, which returns the receipt once the tx is included.
+        self.supports_sync_send = supports_sync_send
+        # A WebSocket endpoint used to follow new blocks and keep the gas values up to date.
+        self.ws_rpc = ws_rpc
 
         if self.coin_symbol:
             self.coin_symbol = self.coin_symbol.upper()
 
     def _get_chain_id(self) -> int:
+        if self.rpc in _RPC_TO_CHAIN_ID:
+            return _RPC_TO_CHAIN_ID[self.rpc]
+
         try:
             return Web3(Web3.HTTPProvider(self.rpc)).eth.chain_id
         except Exception as err:
             raise exceptions.WrongChainID(f'Can not get chain id: {err}')
 
     def _get_coin_symbol(self) -> str:
+        if self.chain_id in _CHAIN_ID_TO_SYMBOL:
+            return _CHAIN_ID_TO_SYMBOL[self.chain_id]
+
         try:
             response = requests.get('https://chainid.network/chains.json').json()
             for network in response:
@@ -163,8 +336,12 @@ class Network:
 
 
 class Networks:
+    """
+    Known networks. Each one is built on first access.
+    """
     # Mainnets
-    Ethereum = Network(
+    Ethereum = LazyAttribute(
+        Network,
         name='ethereum',
         rpc='https://rpc.ankr.com/eth/',
         chain_id=1,
@@ -172,9 +349,11 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='ETH',
         explorer='https://etherscan.io/',
+        block_time=12,
     )
 
-    Arbitrum = Network(
+    Arbitrum = LazyAttribute(
+        Network,
         name='arbitrum',
         rpc='https://arbitrum.llamarpc.com',
         chain_id=42161,
@@ -182,9 +361,11 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='ETH',
         explorer='https://arbiscan.io/',
+        block_time=0.25,
     )
 
-    ArbitrumNova = Network(
+    ArbitrumNova = LazyAttribute(
+        Network,
         name='arbitrum_nova',
         rpc='https://nova.arbitrum.io/rpc/',
         chain_id=42170,
@@ -192,9 +373,11 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='ETH',
         explorer='https://nova.arbiscan.io/',
+        block_time=0.25,
     )
 
-    Optimism = Network(
+    Optimism = LazyAttribute(
+        Network,
         name='optimism',
         rpc='https://rpc.ankr.com/optimism/',
         chain_id=10,
@@ -202,9 +385,11 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='ETH',
         explorer='https://optimistic.etherscan.io/',
+        block_time=2,
     )
 
-    BSC = Network(
+    BSC = LazyAttribute(
+        Network,
         name='bsc',
         rpc='https://rpc.ankr.com/bsc/',
         chain_id=56,
@@ -212,9 +397,11 @@ class Networks:
         coin_symbol='BNB',
         native_coin_decimal=18,
         explorer='https://bscscan.com/',
+        block_time=3,
     )
 
-    Polygon = Network(
+    Polygon = LazyAttribute(
+        Network,
         name='polygon',
         rpc='https://rpc.ankr.com/polygon/',
         chain_id=137,
@@ -222,9 +409,11 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='MATIC',
         explorer='https://polygonscan.com/',
+        block_time=2,
     )
 
-    Avalanche = Network(
+    Avalanche = LazyAttribute(
+        Network,
         name='avalanche',
         rpc='https://rpc.ankr.com/avalanche/',
         chain_id=43114,
@@ -232,10 +421,12 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='AVAX',
         explorer='https://snowtrace.io/',
+        block_time=2,
     )
 
     # Testnets
-    Goerli = Network(
+    Goerli = LazyAttribute(
+        Network,
         name='goerli',
         rpc='https://rpc.ankr.com/eth_goerli/',
         chain_id=5,
@@ -243,8 +434,63 @@ class Networks:
         native_coin_decimal=18,
         coin_symbol='ETH',
         explorer='https://goerli.etherscan.io/',
+        block_time=12,
+    )
+
+
+class GasCache(AutoRepr):
+    """
+    A snapshot of the network gas values in Wei, shared by all clients of the same chain together with the task that
+    keeps it up to date over WebSocket.
+    """
+    __slots__ = (
+        'base_fee', 'max_priority_fee', 'gas_price', 'timestamp', 'tracker', 'tracker_users', '_lock', '_lock_loop'
     )
 
+    def __init__(self) -> None:
+        self.base_fee: int | None = None
+        self.max_priority_fee: int | None = None
+        self.gas_price: int | None = None
+        self.timestamp: float | None = None
+        self.tracker: asyncio.Task | None = None
+        self.tracker_users = 0
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def for_chain(cls, chain_id: int) -> 'GasCache':
+        """Get the gas values snapshot shared by all clients of the chain."""
+        gas_cache = _gas_caches.get(chain_id)
+        if gas_cache is None:
+            gas_cache = _gas_caches[chain_id] = cls()
+
+        return gas_cache
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """The lock guarding a refresh of the snapshot. The cache outlives event loops, so each loop gets a new one."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        return self._lock
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether the snapshot was taken less than `max_age` seconds ago."""
+        return self.timestamp is not None and time.monotonic() - self.timestamp < max_age
+
+    def update(self, gas_price: int, base_fee: int | None = None, max_priority_fee: int | None = None) -> None:
+        """Replace the snapshot with new values."""
+        self.gas_price = gas_price
+        self.base_fee = base_fee
+        self.max_priority_fee = max_priority_fee
+        self.timestamp = time.monotonic()
+
+
+# chain ID -> gas values snapshot of the chain.
+_gas_caches: dict[int, GasCache] = {}
+
 
 class RawContract(AutoRepr):
     """
@@ -256,6 +502,8 @@ class RawContract(AutoRepr):
         abi list[dict[str, Any]] | str: an ABI of the contract.
 
     """
+    __slots__ = ('title', 'address', 'abi')
+
     title: str
     address: ChecksumAddress
     abi: list[dict[str, ...]]
@@ -271,8 +519,8 @@ class RawContract(AutoRepr):
 
         """
         self.title = title
-        self.address = Web3.to_checksum_address(address)
-        self.abi = json.loads(abi) if isinstance(abi, str) else abi
+        self.address = to_checksum_address(address)
+        self.abi = json_loads(abi) if isinstance(abi, (str, bytes)) else abi
 
     def __eq__(self, other) -> bool:
         return self.address == other.address and self.abi == other.abi
@@ -285,19 +533,30 @@ class CommonValues:
     """
     Null: str = '0x0000000000000000000000000000000000000000000000000000000000000000'
     InfinityStr: str = '0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff'
-    InfinityInt: int = int('0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff', 16)
+    InfinityInt: int = 0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff
 
 
 class TxArgs(AutoRepr):
     """
     An instance for named transaction arguments.
     """
+    __slots__ = ('__dict__', '_values')
 
     def __init__(self, **kwargs) -> None:
         self.__dict__.update(kwargs)
+        self._values = tuple(kwargs.values())
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name != '_values':
+            self._values = tuple(self.__dict__.values())
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        self._values = tuple(self.__dict__.values())
 
     def list(self) -> list:
-        return list(self.__dict__.values())
+        return list(self._values)
 
     def tuple(self) -> tuple:
-        return tuple(self.__dict__.values())
+        return self._values
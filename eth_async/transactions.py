@@ -1,23 +1,41 @@
 from __future__ import annotations
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Dict
 
+from aiohttp import ContentTypeError
+from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.contract import Contract, AsyncContract
+from web3.datastructures import AttributeDict
 from web3.types import _Hash32, TxParams
+from web3._utils.method_formatters import receipt_formatter
+from eth_account import Account
 from eth_account.datastructures import SignedTransaction
 
 from .classes import AutoRepr
-from .models import TokenAmount, CommonValues, TxArgs
+from .models import TokenAmount, CommonValues, TxArgs, GasCache, DefaultABIs, RawContract
 from . import exceptions, types
 
 if TYPE_CHECKING:
     from .client import Client
 
+# The selector of the ERC-20 approve(address,uint256) function.
+APPROVE_SELECTOR = '0x095ea7b3'
+
+# Signing is CPU-bound, so it runs in threads shared by all clients to keep the event loop free.
+_sign_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='eth_async_sign')
+
 
 class Tx(AutoRepr):
     """
     An instance of transaction for easy execution of actions on it.
     """
+    __slots__ = ('hash', 'params', 'receipt', 'function_identifier', 'input_data')
 
     def __init__(self, tx_hash: str | _Hash32 | None = None, params: Dict[str, Any] | None = None) -> None:
         """
@@ -52,9 +70,10 @@ class Tx(AutoRepr):
 
     async def wait_for_receipt(
             self, client: Client, timeout: int | float = 120, poll_latency: float = 0.1
-    ) -> Dict[str, Any]:
+    ) -> AttributeDict | Dict[str, Any]:
         """
-        Wait for the transaction receipt.
+        Wait for the transaction receipt. Returns at once if the receipt is already known, e.g. after
+        eth_sendRawTransactionSync.
 
         Args:
             client: The Client instance.
@@ -62,8 +81,11 @@ class Tx(AutoRepr):
             poll_latency: The poll latency in seconds. (Default: 0.1 sec)
 
         Returns:
-            Dict[str, Any]: The transaction receipt.
+            AttributeDict | Dict[str, Any]: The transaction receipt.
         """
+        if self.receipt is not None:
+            return self.receipt
+
         self.receipt = await client.transactions.wait_for_receipt(
             tx_hash=self.hash, timeout=timeout, poll_latency=poll_latency
         )
@@ -94,6 +116,8 @@ class Tx(AutoRepr):
 
 
 class Transaction:
+    __slots__ = ('client', '_decimals', '_decimals_locks')
+
     def __init__(self, client: Client) -> None:
         """
         Initialize the Transaction class.
@@ -102,6 +126,9 @@ class Transaction:
             client: The Client instance.
         """
         self.client = client
+        # Token decimals never change, so they are fetched once per token.
+        self._decimals: Dict[ChecksumAddress, int] = {}
+        self._decimals_locks: Dict[ChecksumAddress, asyncio.Lock] = {}
 
     async def get_gas_price(self) -> TokenAmount:
         """
@@ -110,7 +137,7 @@ class Transaction:
         Returns:
             TokenAmount: The gas price in Wei.
         """
-        return TokenAmount(amount=await self.client.w3.eth.gas_price, wei=True)
+        return TokenAmount(amount=(await self._get_gas_values()).gas_price, wei=True)
 
     async def get_max_priority_fee(self) -> TokenAmount:
         """
@@ -119,7 +146,10 @@ class Transaction:
         Returns:
             TokenAmount: The max priority fee in Wei.
         """
-        return TokenAmount(amount=await self.client.w3.eth.max_priority_fee, wei=True)
+        max_priority_fee = (await self._get_gas_values()).max_priority_fee
+        if max_priority_fee is None:
+            max_priority_fee = await self.client.w3.eth.max_priority_fee
+        return TokenAmount(amount=max_priority_fee, wei=True)
 
     async def get_estimated_gas(self, tx_params: TxParams) -> TokenAmount:
         """
@@ -140,7 +170,64 @@ class Transaction:
         Returns:
             TokenAmount: The base gas fee in Wei.
         """
-        return TokenAmount(amount=(await self.client.w3.eth.get_block('latest'))['baseFeePerGas'], wei=True)
+        base_fee = (await self._get_gas_values()).base_fee
+        if base_fee is None:
+            base_fee = (await self.client.w3.eth.fee_history(1, 'latest'))['baseFeePerGas'][0]
+        return TokenAmount(amount=base_fee, wei=True)
+
+    async def _get_gas_values(self) -> GasCache:
+        """
+        Get the chain's gas values snapshot, refreshing it if it is older than the network block time. While a gas
+        tracker is running (see Client.start_gas_tracker) the snapshot is also updated on every new block.
+
+        Returns:
+            GasCache: The gas values snapshot.
+        """
+        gas_cache = self.client.gas_cache
+        if gas_cache.is_fresh(self.client.network.block_time):
+            return gas_cache
+
+        async with gas_cache.lock:
+            if not gas_cache.is_fresh(self.client.network.block_time):
+                if self.client.network.tx_type == 2:
+                    gas_cache.update(**await self._request_gas_values())
+                else:
+                    gas_cache.update(gas_price=await self.client.w3.eth.gas_price)
+
+        return gas_cache
+
+    async def _request_gas_values(self) -> Dict[str, int]:
+        """
+        Request the gas price, base fee and max priority fee in a single JSON-RPC batch, falling back to separate
+        requests for nodes that reject batches.
+
+        Returns:
+            Dict[str, int]: The 'gas_price', 'base_fee' and 'max_priority_fee' values in Wei.
+        """
+        try:
+            # eth_feeHistory returns the base fee without the block body and its transaction list.
+            gas_price, max_priority_fee, fee_history = await self.client.batch_request(
+                ('eth_gasPrice', []),
+                ('eth_maxPriorityFeePerGas', []),
+                ('eth_feeHistory', ['0x1', 'latest', []]),
+            )
+        except (exceptions.HTTPException, ContentTypeError):
+            gas_price, max_priority_fee, fee_history = await asyncio.gather(
+                self.client.w3.eth.gas_price,
+                self.client.w3.eth.max_priority_fee,
+                self.client.w3.eth.fee_history(1, 'latest'),
+            )
+            return {
+                'gas_price': gas_price,
+                'base_fee': fee_history['baseFeePerGas'][0],
+                'max_priority_fee': max_priority_fee,
+            }
+
+        return {
+            'gas_price': int(gas_price, 16),
+            'base_fee': int(fee_history['baseFeePerGas'][0], 16),
+            'max_priority_fee': int(max_priority_fee, 16),
+        }
 
     async def get_allowance_amount(
             self, owner_address: str, spender_address: str, token_contract: types.Contract
@@ -161,23 +248,35 @@ class Transaction:
             spender_address
         ).call()
 
-    async def get_max_fee_per_gas(self) -> TokenAmount:
+    async def get_max_fee_per_gas(
+            self, base_fee: int | None = None, max_priority_fee: int | None = None
+    ) -> TokenAmount:
         """
         Get the maximum fee per gas.
 
+        Args:
+            base_fee: The base fee in Wei. (Fetched from the network)
+            max_priority_fee: The max priority fee in Wei. (Fetched from the network)
+
         Returns:
             TokenAmount: The maximum fee per gas in Wei.
 
         Raises:
             exceptions.GasValueObtaining: If base fee or max priority fee cannot be obtained.
         """
-        base_fee = (await self.get_base_gas_fee()).Wei
-        max_priority_fee = (await self.get_max_priority_fee()).Wei
+        if base_fee is None and max_priority_fee is None:
+            base_fee, max_priority_fee = await asyncio.gather(self.get_base_gas_fee(), self.get_max_priority_fee())
+            base_fee, max_priority_fee = base_fee.Wei, max_priority_fee.Wei
+        elif base_fee is None:
+            base_fee = (await self.get_base_gas_fee()).Wei
+        elif max_priority_fee is None:
+            max_priority_fee = (await self.get_max_priority_fee()).Wei
 
         if base_fee is None or max_priority_fee is None:
             raise exceptions.GasValueObtaining()
 
-        return TokenAmount(amount=(max_priority_fee * 2) + (base_fee * 1.05), wei=True)
+        # A 5% base fee premium in integer math, since floats lose precision on Wei values.
+        return TokenAmount(amount=max_priority_fee * 2 + base_fee * 21 // 20, wei=True)
 
     async def sign_transaction(self, tx_params: TxParams) -> SignedTransaction:
         """
@@ -189,8 +288,8 @@ class Transaction:
         Returns:
             SignedTransaction: The signed transaction.
         """
-        return self.client.w3.eth.account.sign_transaction(
-            transaction_dict=tx_params, private_key=self.client.account.key
+        return await asyncio.get_running_loop().run_in_executor(
+            _sign_pool, Account.sign_transaction, tx_params, self.client.signing_key
         )
 
     async def auto_add_params(self, tx_params: TxParams) -> TxParams:
@@ -204,16 +303,25 @@ class Transaction:
             TxParams: The transaction parameters with added values.
         """
         tx_params['chainId'] = tx_params.get('chainId', self.client.network.chain_id)
-        tx_params['nonce'] = await self.client.wallet.nonce()
-        tx_params['from'] = self.client.account.address
+        tx_params.setdefault('from', self.client.account.address)
 
+        # Fee values come from the gas snapshot, which is refreshed in one batch request at most once per block.
+        if 'nonce' in tx_params:
+            gas_values = await self._get_gas_values()
+        else:
+            tx_params['nonce'], gas_values = await asyncio.gather(
+                self.client.wallet.next_nonce(), self._get_gas_values()
+            )
         if self.client.network.tx_type == 2:
-            tx_params['maxPriorityFeePerGas'] = (await self.get_max_priority_fee()).Wei
-            tx_params['maxFeePerGas'] = (await self.get_max_fee_per_gas()).Wei
+            tx_params['maxPriorityFeePerGas'] = gas_values.max_priority_fee
+            tx_params['maxFeePerGas'] = (await self.get_max_fee_per_gas(
+                base_fee=gas_values.base_fee, max_priority_fee=gas_values.max_priority_fee
+            )).Wei
         else:
-            tx_params['gasPrice'] = (await self.get_gas_price()).Wei
+            tx_params['gasPrice'] = gas_values.gas_price
 
-        tx_params['gas'] = (await self.get_estimated_gas(tx_params=tx_params)).Wei
+        if 'gas' not in tx_params:
+            tx_params['gas'] = (await self.get_estimated_gas(tx_params=tx_params)).Wei
 
         return tx_params
 
@@ -221,6 +329,7 @@ class Transaction:
         """
         Sign and send a transaction. Additionally, add 'chainId', 'nonce', 'from', 'gasPrice' or
         'maxFeePerGas' + 'maxPriorityFeePerGas' and 'gas' parameters to transaction parameters if they are missing.
+        Missing nonces are counted locally by Wallet.next_nonce, so consecutive transactions can be sent concurrently.
 
         Args:
             tx_params: The parameters of the transaction.
@@ -228,11 +337,47 @@ class Transaction:
         Returns:
             Tx: An instance of the sent transaction.
         """
-        tx_params = await self.auto_add_params(tx_params=tx_params)
-        signed_tx = await self.sign_transaction(tx_params=tx_params)
-        tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+        try:
+            tx_params = await self.auto_add_params(tx_params=tx_params)
+            signed_tx = await self.sign_transaction(tx_params=tx_params)
+            if self.client.network.supports_sync_send:
+                return await self._send_raw_transaction_sync(signed_tx=signed_tx, tx_params=tx_params)
+
+            tx_hash = await self.client.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+        except Exception:
+            # The locally counted nonce may now be ahead of the chain, so request it again for the next transaction.
+            self.client.wallet.reset_nonce()
+            raise
+
         return Tx(tx_hash=tx_hash, params=tx_params)
 
+    async def _send_raw_transaction_sync(self, signed_tx: SignedTransaction, tx_params: TxParams) -> Tx:
+        """
+        Send a signed transaction with eth_sendRawTransactionSync, which returns the receipt once the transaction is
+        included, so no receipt polling is needed.
+
+        Args:
+            signed_tx: The signed transaction.
+            tx_params: The parameters of the transaction.
+
+        Returns:
+            Tx: An instance of the sent transaction with its receipt.
+
+        Raises:
+            exceptions.TransactionException: If the node returns an error.
+        """
+        response = await self.client.w3.provider.make_request(
+            'eth_sendRawTransactionSync', [Web3.to_hex(signed_tx.rawTransaction)]
+        )
+        if 'error' in response:
+            raise exceptions.TransactionException(f"Can not send transaction: {response['error']}")
+
+        # Bring the raw JSON-RPC receipt to the same shape get_transaction_receipt returns (ints, HexBytes).
+        receipt = receipt_formatter(response['result'])
+        tx = Tx(tx_hash=receipt['transactionHash'], params=tx_params)
+        tx.receipt = receipt
+        return tx
+
     async def get_approved_token_amount(
             self,
             token_contract: types.Contract,
@@ -250,6 +395,7 @@ class Transaction:
         Returns:
             TokenAmount: The approved amount.
         """
+        token_contract = await self._get_token_contract(token_contract)
         allowance_amount = await self.get_allowance_amount(
             owner_address=owner_address, spender_address=spender_address, token_contract=token_contract
         )
@@ -263,21 +409,43 @@ class Transaction:
             tx_hash: str | _Hash32,
             timeout: int | float = 120,
             poll_latency: float = 0.1
-    ) -> Dict[str, Any]:
+    ) -> AttributeDict | Dict[str, Any]:
         """
         Wait for a transaction receipt.
 
         Args:
             tx_hash: The transaction hash.
             timeout: The receipt waiting timeout in seconds. (Default: 120)
-            poll_latency: The poll latency in seconds. (Default: 0.1 sec)
+            poll_latency: The first poll latency in seconds, doubled after each poll up to the network block time.
+                (Default: 0.1 sec)
 
         Returns:
-            Dict[str, Any]: The transaction receipt.
-        """
-        return dict(await self.client.w3.eth.wait_for_transaction_receipt(
-            transaction_hash=tx_hash, timeout=timeout, poll_latency=poll_latency
-        ))
+            AttributeDict | Dict[str, Any]: The transaction receipt.
+
+        Raises:
+            TimeExhausted: If the receipt is not available within the timeout. The locally counted nonce is reset then.
+        """
+        deadline = time.monotonic() + timeout
+        delay = poll_latency
+        while True:
+            try:
+                receipt = await self.client.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                receipt = None
+
+            if receipt is not None:
+                return receipt
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # The transaction may have been dropped, leaving a gap that would hold every later nonce in the queue.
+                self.client.wallet.reset_nonce()
+                raise TimeExhausted(
+                    f'Transaction {HexBytes(tx_hash).hex()} is not in the chain after {timeout} seconds'
+                )
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max(self.client.network.block_time, poll_latency))
 
     async def approve_token_spending(
             self,
@@ -298,7 +466,8 @@ class Transaction:
         Returns:
             Tx: The instance of the sent transaction.
         """
-        amount = await self._determine_approve_amount(amount=amount, token_contract=token_contract.address)
+        token_contract = await self._get_token_contract(token_contract)
+        amount = await self._determine_approve_amount(amount=amount, token_contract=token_contract)
 
         tx_params = await self._build_tx_approve_params(
             token_contract=token_contract, spender_address=spender_address, amount=amount, gas_limit=gas_limit
@@ -306,6 +475,27 @@ class Transaction:
 
         return await self.sign_and_send_transaction(tx_params=tx_params)
 
+    async def _get_token_contract(self, token_contract: types.Contract) -> Contract | AsyncContract:
+        """
+        Resolve a token to a contract instance once, so the following steps can reuse it.
+
+        Args:
+            token_contract: The contract address or instance of token.
+
+        Returns:
+            Contract | AsyncContract: The token contract instance.
+        """
+        if isinstance(token_contract, AsyncContract):
+            return token_contract
+
+        if isinstance(token_contract, RawContract):
+            if token_contract.abi:
+                # Passed as is, so its ABI is used by identity and the instance comes from the contract cache.
+                return await self.client.contracts.get_contract_instance(contract_address=token_contract)
+            token_contract = token_contract.address
+
+        return await self.client.contracts.get_default_contract_instance(contract_address=token_contract)
+
     async def _determine_approve_amount(
             self, amount: types.Amount | None, token_contract: Contract | AsyncContract
     ) -> int:
@@ -314,7 +504,7 @@ class Transaction:
 
         Args:
             amount: The amount to approve.
-            contract: The token contract instance.
+            token_contract: The token contract instance.
 
         Returns:
             int: The amount to approve in Wei.
@@ -347,13 +537,11 @@ class Transaction:
         Returns:
             TxParams: The transaction parameters.
         """
-        tx_args = TxArgs(spender=spender_address, amount=amount)
-
         tx_params = {
-            'nonce': await self.client.wallet.nonce(),
             'to': token_contract.address,
-            'data': token_contract.encodeABI('approve', args=tx_args.tuple()),
-            'from': self.client.account.address
+            'data': self._encode_approve(
+                token_contract=token_contract, spender_address=spender_address, amount=amount
+            )
         }
 
         if gas_limit:
@@ -363,6 +551,48 @@ class Transaction:
 
         return tx_params
 
+    def _encode_approve(self, token_contract: Contract | AsyncContract, spender_address: str, amount: int) -> str:
+        """
+        Encode the approve call data. For tokens with the default ABI the standard approve(address,uint256) call data
+        is assembled directly, skipping the ABI lookup.
+
+        Args:
+            token_contract: The token contract instance.
+            spender_address: The spender address.
+            amount: The amount to approve.
+
+        Returns:
+            str: The hex encoded call data.
+        """
+        if token_contract.abi is DefaultABIs.Token and 0 <= amount <= CommonValues.InfinityInt:
+            spender_address, _ = self.client.contracts.parse_contract_attributes(spender_address)
+            return f'{APPROVE_SELECTOR}{spender_address[2:].lower():0>64}{amount:064x}'
+
+        tx_args = TxArgs(spender=spender_address, amount=amount)
+        return token_contract.encodeABI('approve', args=tx_args.tuple())
+
+    def get_cached_decimals(self, contract_address: ChecksumAddress) -> int | None:
+        """
+        Get the decimals of a token if they are already known.
+
+        Args:
+            contract_address: The checksummed token contract address.
+
+        Returns:
+            int | None: The number of decimals, or None if they haven't been fetched yet.
+        """
+        return self._decimals.get(contract_address)
+
+    def cache_decimals(self, contract_address: ChecksumAddress, decimals: int) -> None:
+        """
+        Remember the decimals of a token fetched elsewhere, so get_decimals doesn't request them again.
+
+        Args:
+            contract_address: The checksummed token contract address.
+            decimals: The number of decimals.
+        """
+        self._decimals[contract_address] = decimals
+
     async def get_decimals(self, contract: types.Contract) -> int:
         """
         Get the decimals for a token contract.
@@ -373,9 +603,20 @@ class Transaction:
         Returns:
             int: The number of decimals.
         """
-        contract_address, abi = await self.client.contracts.get_contract_attributes(contract)
-        contract = await self.client.contracts.get_default_contract_instance(contract_address=contract_address)
-        return await contract.functions.decimals().call()
+        contract_address, abi = self.client.contracts.parse_contract_attributes(contract)
+        if contract_address in self._decimals:
+            return self._decimals[contract_address]
+
+        # Concurrent first requests for the same token wait for a single call.
+        async with self._decimals_locks.setdefault(contract_address, asyncio.Lock()):
+            if contract_address not in self._decimals:
+                if not isinstance(contract, (Contract, AsyncContract)):
+                    contract = await self.client.contracts.get_minimal_contract_instance(
+                        contract_address=contract_address
+                    )
+                self._decimals[contract_address] = await contract.functions.decimals().call()
+
+        return self._decimals[contract_address]
 
     async def sign_message(self):
         """
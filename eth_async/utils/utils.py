@@ -1,9 +1,19 @@
-import json
+import asyncio
+import atexit
 import os
+from functools import lru_cache
 
 import aiohttp
+from eth_typing import ChecksumAddress
+from web3 import Web3
+
 from eth_async import exceptions
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 def join_path(path: str | tuple | list) -> str:
     if isinstance(path, str):
@@ -11,10 +21,116 @@ def join_path(path: str | tuple | list) -> str:
     return str(os.path.join(*path))
 
 
+def to_checksum_address(address: str | bytes) -> ChecksumAddress:
+    """
+    Convert an address to its EIP-55 checksum form, caching the result since the conversion hashes the address.
+
+    Args:
+        address (str | bytes): an address.
+
+    Returns:
+        ChecksumAddress: the checksummed address.
+
+    """
+    # The checksum only depends on the lowercase address, so all spellings of an address share one cache entry.
+    if isinstance(address, str):
+        address = address.lower()
+    return _to_checksum_address(address)
+
+
+@lru_cache(maxsize=4096)
+def _to_checksum_address(address: str | bytes) -> ChecksumAddress:
+    return Web3.to_checksum_address(address)
+
+
 def read_json(path: str | tuple | list, encoding: str | None = None) -> list | dict:
     path = join_path(path)
-    with open(path, encoding=encoding) as file:
-        return json.load(file)
+    if encoding:
+        with open(path, encoding=encoding) as file:
+            return json_loads(file.read())
+
+    with open(path, 'rb') as file:
+        return json_loads(file.read())
+
+
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+_session_users = 0
+_session_closer = None
+
+
+async def _close_on_loop_shutdown(session: aiohttp.ClientSession):
+    """
+    Close the session when its event loop shuts down. asyncio.run finalizes the pending async generators of the loop
+    before closing it, so a session nobody closed explicitly is still closed while its loop can run.
+    """
+    try:
+        yield
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+@atexit.register
+def _close_session_at_exit() -> None:
+    # Loops driven with run_until_complete are never shut down, so close the session on exit if its loop still can.
+    if _session_closer is not None and not _session_loop.is_closed() and not _session_loop.is_running():
+        _session_loop.run_until_complete(_session_closer.aclose())
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the HTTP session shared by all requests, so connections are pooled and kept alive between them.
+
+    Returns:
+        aiohttp.ClientSession: the session bound to the running event loop.
+
+    """
+    global _session, _session_loop, _session_closer
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            # A session can't be used from another event loop. Closing it may fail if its loop is already closed,
+            # in which case its connections are gone anyway.
+            try:
+                await _session.close()
+            except Exception:
+                pass
+
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=75, enable_cleanup_closed=True)
+        )
+        _session_loop = loop
+        _session_closer = _close_on_loop_shutdown(_session)
+        await _session_closer.__anext__()
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def retain_session() -> None:
+    """Register a user of the shared HTTP session, which stays open until all users release it."""
+    global _session_users
+
+    _session_users += 1
+
+
+async def release_session() -> None:
+    """Release the shared HTTP session, closing it when its last user is released."""
+    global _session_users
+
+    _session_users = max(_session_users - 1, 0)
+    if not _session_users:
+        await close_session()
 
 
 async def async_get(url: str, headers: dict | None = None, **kwargs) -> dict | None:
@@ -30,11 +146,34 @@ async def async_get(url: str, headers: dict | None = None, **kwargs) -> dict | N
         Optional[dict]: received dictionary in response.
 
     """
-    async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.get(url=url, **kwargs) as response:
-            status_code = response.status
-            response = await response.json()
-            if status_code <= 201:
-                return response
+    session = await get_session()
+    async with session.get(url=url, headers=headers, **kwargs) as response:
+        status_code = response.status
+        response = await response.json()
+        if status_code <= 201:
+            return response
+
+        raise exceptions.HTTPException(response=response, status_code=status_code)
+
+
+async def async_post(url: str, headers: dict | None = None, **kwargs) -> dict | list | None:
+    """
+    Make a POST request and check if it was successful.
+
+    Args:
+        url (str): a URL.
+        headers (Optional[dict]): the headers. (None)
+        **kwargs: arguments for a POST request, e.g. 'params', 'data', 'json' or 'proxy'.
+
+    Returns:
+        Optional[dict | list]: received JSON in response.
+
+    """
+    session = await get_session()
+    async with session.post(url=url, headers=headers, **kwargs) as response:
+        status_code = response.status
+        response = await response.json()
+        if status_code <= 201:
+            return response
 
-            raise exceptions.HTTPException(response=response, status_code=status_code)
+        raise exceptions.HTTPException(response=response, status_code=status_code)
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import asyncio
+import time
 from typing import TYPE_CHECKING
 
 from web3 import Web3
@@ -9,10 +11,22 @@ from .models import TokenAmount
 if TYPE_CHECKING:
     from .client import Client
 
+# The selectors of the ERC-20 balanceOf(address) and decimals() functions.
+BALANCE_OF_SELECTOR = '0x70a08231'
+DECIMALS_SELECTOR = '0x313ce567'
+
+# Seconds without transactions after which the locally counted nonce is checked against the network again.
+NONCE_IDLE_RESYNC = 60
+
 
 class Wallet:
+    __slots__ = ('client', '_next_nonce', '_nonce_lock', '_nonce_used_at')
+
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._next_nonce: int | None = None
+        self._nonce_lock = asyncio.Lock()
+        self._nonce_used_at = 0.0
 
     async def balance(
             self,
@@ -20,23 +34,93 @@ class Wallet:
             address: str | ChecksumAddress | None = None,
             decimals: int = 18
     ) -> TokenAmount:
-        address = self.client.get_checksum_address(address or self.client.account.address)
+        address = self.client.get_checksum_address(address) if address else self.client.account.address
 
         if not token_address:
             return await self._get_eth_balance(address, decimals)
         return await self._get_token_balance(token_address, address)
 
+    async def balances(
+            self,
+            token_addresses: list[str | ChecksumAddress],
+            address: str | ChecksumAddress | None = None
+    ) -> list[TokenAmount]:
+        """
+        Get balances of several tokens in a single batch request.
+
+        Args:
+            token_addresses: The token addresses.
+            address: The owner address. (Imported to client address)
+
+        Returns:
+            list[TokenAmount]: The balances, in the order of the token addresses.
+        """
+        if not token_addresses:
+            return []
+
+        address = self.client.get_checksum_address(address) if address else self.client.account.address
+        token_addresses = [self.client.get_checksum_address(token_address) for token_address in token_addresses]
+
+        # Decimals are only requested for tokens that are not in the decimals cache yet.
+        transactions = self.client.transactions
+        unknown_tokens = [
+            token for token in dict.fromkeys(token_addresses) if transactions.get_cached_decimals(token) is None
+        ]
+
+        balance_of_data = f'{BALANCE_OF_SELECTOR}{address[2:].lower():0>64}'
+        results = await self.client.batch_request(
+            *(('eth_call', [{'to': token, 'data': balance_of_data}, 'latest']) for token in token_addresses),
+            *(('eth_call', [{'to': token, 'data': DECIMALS_SELECTOR}, 'latest']) for token in unknown_tokens)
+        )
+
+        for token_address, token_decimals in zip(unknown_tokens, results[len(token_addresses):]):
+            transactions.cache_decimals(token_address, int(token_decimals, 16))
+
+        return [
+            TokenAmount(
+                amount=int(balance, 16), decimals=transactions.get_cached_decimals(token_address), wei=True
+            )
+            for token_address, balance in zip(token_addresses, results)
+        ]
+
     async def nonce(self, address: ChecksumAddress | None = None) -> int:
-        address = address or self.client.account.address
+        address = self.client.get_checksum_address(address) if address else self.client.account.address
         return await self.client.w3.eth.get_transaction_count(address)
 
+    async def next_nonce(self) -> int:
+        """
+        Get the nonce for the next transaction of the client account. The pending nonce is requested once and then
+        counted locally, so back-to-back transactions don't need a request each. After NONCE_IDLE_RESYNC seconds
+        without transactions it is requested again, since a dropped transaction or another sender using the same key
+        can leave the local count out of step with the chain.
+
+        Returns:
+            int: The nonce.
+        """
+        async with self._nonce_lock:
+            now = time.monotonic()
+            if self._next_nonce is None or now - self._nonce_used_at > NONCE_IDLE_RESYNC:
+                self._next_nonce = await self.client.w3.eth.get_transaction_count(
+                    self.client.account.address, 'pending'
+                )
+
+            self._nonce_used_at = now
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def reset_nonce(self) -> None:
+        """Forget the locally counted nonce, so the next one is requested from the network."""
+        self._next_nonce = None
+
     async def _get_eth_balance(self, address: ChecksumAddress, decimals: int) -> TokenAmount:
         balance = await self.client.w3.eth.get_balance(account=address)
         return TokenAmount(amount=balance, decimals=decimals, wei=True)
 
     async def _get_token_balance(self, token_address: str | ChecksumAddress, address: ChecksumAddress) -> TokenAmount:
         token_address = self.client.get_checksum_address(token_address)
-        contract = await self.client.contracts.get_default_contract_instance(contract_address=token_address)
-        balance = await contract.functions.balanceOf(address).call()
-        token_decimals = await contract.functions.decimals().call()
+        contract = await self.client.contracts.get_minimal_contract_instance(contract_address=token_address)
+        balance, token_decimals = await asyncio.gather(
+            contract.functions.balanceOf(address).call(), self.client.transactions.get_decimals(contract=contract)
+        )
         return TokenAmount(amount=balance, decimals=token_decimals, wei=True)